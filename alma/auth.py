@@ -1,11 +1,12 @@
 """Authentication module with Google OAuth 2.0 and session management."""
 
 import os
-from typing import Annotated
+from functools import lru_cache
 from urllib.parse import urlencode
 
 import httpx
-from fastapi import Cookie, HTTPException
+from fastapi import Request
+from fastapi.responses import RedirectResponse
 from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
 
 # Load configuration from environment
@@ -22,6 +23,15 @@ GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
 # Session settings
 SESSION_MAX_AGE = 604800  # 1 week in seconds
 
+# Path prefixes served without a session
+PUBLIC_PATHS = ("/login", "/auth/", "/static/", "/docs", "/redoc", "/openapi.json")
+
+# Session cookie signer; validate_config refuses to start without SECRET_KEY
+_SERIALIZER = URLSafeTimedSerializer(SECRET_KEY, salt="session") if SECRET_KEY else None
+
+# Shared HTTP client, so OAuth calls reuse pooled connections to Google
+_http_client: httpx.AsyncClient | None = None
+
 
 def validate_config():
     """Validate that all required environment variables are set."""
@@ -44,8 +54,9 @@ def validate_config():
     return True
 
 
+@lru_cache(maxsize=32)
 def get_google_auth_url(redirect_uri: str | None = None) -> str:
-    """Generate Google OAuth authorization URL."""
+    """Generate Google OAuth authorization URL (cached per redirect URI)."""
     params = {
         "client_id": GOOGLE_CLIENT_ID,
         "redirect_uri": redirect_uri or GOOGLE_REDIRECT_URI,
@@ -57,38 +68,51 @@ def get_google_auth_url(redirect_uri: str | None = None) -> str:
     return f"{GOOGLE_AUTH_URL}?{urlencode(params)}"
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient()
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client (on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 async def exchange_code_for_token(code: str, redirect_uri: str | None = None) -> dict:
     """Exchange authorization code for access token."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            GOOGLE_TOKEN_URL,
-            data={
-                "code": code,
-                "client_id": GOOGLE_CLIENT_ID,
-                "client_secret": GOOGLE_CLIENT_SECRET,
-                "redirect_uri": redirect_uri or GOOGLE_REDIRECT_URI,
-                "grant_type": "authorization_code",
-            },
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await get_http_client().post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "code": code,
+            "client_id": GOOGLE_CLIENT_ID,
+            "client_secret": GOOGLE_CLIENT_SECRET,
+            "redirect_uri": redirect_uri or GOOGLE_REDIRECT_URI,
+            "grant_type": "authorization_code",
+        },
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 async def get_user_info(access_token: str) -> dict:
     """Get user information from Google using access token."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            GOOGLE_USERINFO_URL,
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await get_http_client().get(
+        GOOGLE_USERINFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 def create_session_cookie(user_email: str) -> str:
     """Create signed session cookie containing user email."""
-    serializer = URLSafeTimedSerializer(SECRET_KEY)
-    return serializer.dumps(user_email, salt="session")
+    return _SERIALIZER.dumps(user_email)
 
 
 def verify_session_cookie(cookie: str) -> str | None:
@@ -97,33 +121,27 @@ def verify_session_cookie(cookie: str) -> str | None:
         return None
 
     try:
-        serializer = URLSafeTimedSerializer(SECRET_KEY)
-        user_email = serializer.loads(
-            cookie, salt="session", max_age=SESSION_MAX_AGE
-        )
-        return user_email
+        return _SERIALIZER.loads(cookie, max_age=SESSION_MAX_AGE)
     except (BadSignature, SignatureExpired):
         return None
 
 
-async def require_auth(
-    session: Annotated[str | None, Cookie()] = None
-) -> str:
+async def auth_middleware(request: Request, call_next):
     """
-    FastAPI dependency that requires valid authentication.
-    Returns user email if authenticated, otherwise raises HTTPException.
+    HTTP middleware that requires valid authentication outside PUBLIC_PATHS.
+    Stores the user email on request.state, otherwise redirects to login.
     """
-    if not session:
-        raise HTTPException(
-            status_code=302,
-            headers={"Location": "/login"}
-        )
+    if request.url.path.startswith(PUBLIC_PATHS):
+        return await call_next(request)
 
-    user_email = verify_session_cookie(session)
+    user_email = verify_session_cookie(request.cookies.get("session"))
     if not user_email:
-        raise HTTPException(
-            status_code=302,
-            headers={"Location": "/login"}
-        )
+        return RedirectResponse("/login", status_code=302)
+
+    request.state.user = user_email
+    return await call_next(request)
+
 
-    return user_email
+async def require_auth(request: Request) -> str:
+    """FastAPI dependency returning the user email verified by auth_middleware."""
+    return request.state.user
@@ -1,47 +1,88 @@
 """Performance caching utilities."""
 
+import time
+from collections import OrderedDict
 from functools import lru_cache
-from datetime import datetime, timedelta
 from typing import Any, Optional
 
-# Simple in-memory cache with TTL
-_cache: dict[str, tuple[Any, datetime]] = {}
-_cache_timeout = timedelta(minutes=5)
+# Simple in-memory cache with TTL, bounded by evicting least recently used
+# entries. Values are stored with their monotonic-clock expiry time.
+_cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+_cache_timeout = 300.0  # seconds
+_cache_maxsize = 10_000
+
+# Reverse index: key prefix (e.g. "notes:") -> cached keys with that prefix
+_keys_by_prefix: dict[str, set[str]] = {}
+
+
+def _key_prefix(key: str) -> str:
+    """Get the namespace prefix of a cache key, including the colon."""
+    return key.split(":", 1)[0] + ":"
+
+
+def _drop(key: str) -> None:
+    """Remove a key from the reverse index."""
+    prefix = _key_prefix(key)
+    keys = _keys_by_prefix.get(prefix)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del _keys_by_prefix[prefix]
 
 
 def cache_get(key: str) -> Optional[Any]:
     """Get from cache if not expired."""
-    if key in _cache:
-        value, timestamp = _cache[key]
-        if datetime.now() - timestamp < _cache_timeout:
-            return value
-        else:
-            # Expired, remove it
-            del _cache[key]
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    value, expires = entry
+    if time.monotonic() < expires:
+        _cache.move_to_end(key)
+        return value
+    # Expired, remove it
+    del _cache[key]
+    _drop(key)
     return None
 
 
 def cache_set(key: str, value: Any) -> None:
-    """Set cache value with current timestamp."""
-    _cache[key] = (value, datetime.now())
+    """Set cache value, evicting the least recently used entry when full."""
+    _cache[key] = (value, time.monotonic() + _cache_timeout)
+    _cache.move_to_end(key)
+    _keys_by_prefix.setdefault(_key_prefix(key), set()).add(key)
+    if len(_cache) > _cache_maxsize:
+        evicted, _ = _cache.popitem(last=False)
+        _drop(evicted)
 
 
 def cache_invalidate(key: str) -> None:
     """Invalidate a specific cache entry."""
     if key in _cache:
         del _cache[key]
+        _drop(key)
 
 
 def cache_clear() -> None:
     """Clear all cache entries."""
     _cache.clear()
+    _keys_by_prefix.clear()
 
 
 def cache_invalidate_pattern(pattern: str) -> None:
-    """Invalidate all cache entries matching a pattern."""
+    """Invalidate all cache entries matching a pattern.
+
+    A namespace prefix such as "notes:" drops exactly the keys starting with
+    it via the reverse index; any other pattern is matched as a substring.
+    """
+    if pattern == _key_prefix(pattern):
+        for key in _keys_by_prefix.pop(pattern, ()):
+            _cache.pop(key, None)
+        return
+
     keys_to_delete = [key for key in _cache.keys() if pattern in key]
     for key in keys_to_delete:
         del _cache[key]
+        _drop(key)
 
 
 # LRU cache for frequently accessed functions
@@ -1,31 +1,288 @@
-"""Index management system for fast note lookups."""
-
-import json
+"""Index management system for fast note lookups.
+
+Indexes are kept in memory once loaded. Mutations mark an index dirty and
+schedule a debounced flush, which writes each dirty index to disk atomically
+(temp file + ``os.replace``), so a burst of note edits costs one rewrite.
+"""
+
+import atexit
+import bisect
+import heapq
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Set
 
+import orjson
+
+from . import search_index
+
+# Created by the app's startup (and by clear_all_indexes for the CLI)
 INDEXES_DIR = Path(".indexes")
-INDEXES_DIR.mkdir(exist_ok=True)
 
 # Index file paths
 PROJECTS_INDEX = INDEXES_DIR / "projects.json"
 TAGS_INDEX = INDEXES_DIR / "tags.json"
 METADATA_INDEX = INDEXES_DIR / "metadata.json"
+WIKI_LINKS_INDEX = INDEXES_DIR / "wiki-links.json"
+WIKI_BACKLINKS_INDEX = INDEXES_DIR / "wiki-backlinks.json"
 
+# Indexes derived from the note files, i.e. what regeneration rebuilds.
+# Other files in INDEXES_DIR (such as the projects config) are not indexes.
+NOTE_INDEXES = (PROJECTS_INDEX, TAGS_INDEX, METADATA_INDEX, WIKI_LINKS_INDEX, WIKI_BACKLINKS_INDEX)
 
-def load_index(index_path: Path) -> dict:
-    """Load index from JSON file."""
+# Present while index changes exist only in memory; if it survives a restart,
+# the last flush didn't happen and the indexes must be regenerated
+DIRTY_MARKER = INDEXES_DIR / ".dirty"
+
+# Seconds to wait for further mutations before writing dirty indexes
+FLUSH_DELAY = 0.5
+
+# In-memory indexes, keyed by absolute path so a cwd change can't mix trees
+_INDEX_CACHE: Dict[Path, dict] = {}
+_DIRTY: Set[Path] = set()
+# Guards the in-memory indexes; hold it while mutating a loaded index
+LOCK = threading.RLock()
+_FLUSH_LOCK = threading.Lock()
+_flush_timer: threading.Timer | None = None
+_batch_depth = 0
+
+# Bumped whenever an in-memory index is loaded, replaced or dropped, so
+# callers can cache values derived from the indexes
+_generation = 0
+
+# Internal integer IDs for notes, used as keys by the in-memory postings.
+# The UUID stays the external identity and is what the index files store.
+_DOC_IDS: Dict[str, int] = {}
+_NOTE_IDS: List[str] = []  # doc ID -> note UUID
+
+# Facet postings (project / tag -> doc IDs) derived from the projects and
+# tags indexes, built on first query and dropped whenever that index changes
+_POSTINGS: Dict[Path, Dict[str, Set[int]]] = {}
+
+# Indexes built in memory from other indexes (e.g. the backlinks index when
+# its file is missing), so each is built once; dropped with the cache
+_BUILT: Set[Path] = set()
+
+# (created, note_id) pairs in ascending order, built from the metadata index
+# on first use and patched on every metadata mutation
+_sorted_by_created: List[tuple] | None = None
+
+# Lowercased title -> note ID (newest note wins), built from the metadata
+# index on first lookup and dropped whenever a title may have changed
+_ids_by_title: Dict[str, str] | None = None
+
+
+def _read_index_file(index_path: Path) -> dict:
+    """Read index from JSON file."""
     if not index_path.exists():
         return {}
     try:
-        return json.loads(index_path.read_text())
-    except (json.JSONDecodeError, IOError):
+        return orjson.loads(index_path.read_bytes())
+    except (orjson.JSONDecodeError, IOError):
         return {}
 
 
+def _tmp_path(index_path: Path) -> Path:
+    """Temp file an index is written to before being swapped in."""
+    return index_path.with_suffix(index_path.suffix + ".tmp")
+
+
+def _write_tmp_file(path: Path, payload: bytes):
+    """Write and fsync the temp file for path."""
+    with open(_tmp_path(path), "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def write_file_atomic(path: Path, payload: bytes):
+    """Replace a file's contents atomically, so readers never see a torn file."""
+    _write_tmp_file(path, payload)
+    os.replace(_tmp_path(path), path)
+
+
+def _write_index_files(payloads: Dict[Path, bytes]) -> List[Path]:
+    """Write a batch of index files, returning the paths that failed.
+
+    All temp files are written and fsynced first, then swapped in with
+    os.replace back to back, and each directory is fsynced once at the end.
+    """
+    written = []
+    failed = []
+    for index_path, payload in payloads.items():
+        try:
+            _write_tmp_file(index_path, payload)
+            written.append(index_path)
+        except OSError as e:
+            print(f"Error writing index {index_path}: {e}")
+            failed.append(index_path)
+
+    for index_path in written:
+        try:
+            os.replace(_tmp_path(index_path), index_path)
+        except OSError as e:
+            print(f"Error replacing index {index_path}: {e}")
+            failed.append(index_path)
+
+    # Make the renames durable (not supported on all platforms)
+    if hasattr(os, "O_DIRECTORY"):
+        for directory in {index_path.parent for index_path in written}:
+            fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    return failed
+
+
+def load_index(index_path: Path) -> dict:
+    """Load index, reading the JSON file only on first access."""
+    global _generation
+    key = index_path.absolute()
+    with LOCK:
+        index = _INDEX_CACHE.get(key)
+        if index is None:
+            index = _INDEX_CACHE[key] = _read_index_file(key)
+            _generation += 1
+        return index
+
+
 def save_index(index_path: Path, data: dict):
-    """Save index to JSON file."""
-    index_path.write_text(json.dumps(data, indent=2))
+    """Store index in memory and schedule a flush to disk."""
+    global _generation
+    key = index_path.absolute()
+    with LOCK:
+        _INDEX_CACHE[key] = data
+        _POSTINGS.pop(key, None)
+        _generation += 1
+        if not _DIRTY:
+            _set_dirty_marker(key.parent / DIRTY_MARKER.name)
+        _DIRTY.add(key)
+        if not _batch_depth:
+            _schedule_flush()
+
+
+@contextmanager
+def batch():
+    """Apply several index updates as one unit.
+
+    The index lock is held throughout, so a flush never writes a half-applied
+    note change, and the flush is scheduled once when the batch ends.
+    """
+    global _batch_depth
+    with LOCK:
+        _batch_depth += 1
+        try:
+            yield
+        finally:
+            _batch_depth -= 1
+            if not _batch_depth and _DIRTY:
+                _schedule_flush()
+
+
+def generation() -> int:
+    """Get a counter that changes whenever any in-memory index may have changed."""
+    return _generation
+
+
+def is_built(index_path: Path) -> bool:
+    """Check whether a derived index has been built or loaded since the last reset."""
+    return index_path.absolute() in _BUILT
+
+
+def mark_built(index_path: Path):
+    """Record that a derived index is up to date in memory."""
+    _BUILT.add(index_path.absolute())
+
+
+def doc_id(note_id: str) -> int:
+    """Get the internal integer ID of a note, assigning one on first use."""
+    did = _DOC_IDS.get(note_id)
+    if did is None:
+        did = _DOC_IDS[note_id] = len(_NOTE_IDS)
+        _NOTE_IDS.append(note_id)
+    return did
+
+
+def note_id_for(did: int) -> str:
+    """Get the note UUID for an internal integer ID."""
+    return _NOTE_IDS[did]
+
+
+def _set_dirty_marker(marker: Path):
+    """Record on disk that there are unflushed index changes."""
+    try:
+        marker.touch()
+    except OSError as e:
+        print(f"Error writing index marker {marker}: {e}")
+
+
+def needs_recovery() -> bool:
+    """Check whether a previous run exited with unflushed index changes."""
+    return DIRTY_MARKER.exists()
+
+
+def _schedule_flush():
+    """Start the debounce timer unless a flush is already pending."""
+    global _flush_timer
+    if _flush_timer is None:
+        _flush_timer = threading.Timer(FLUSH_DELAY, flush_all)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def flush_all():
+    """Write all dirty indexes to disk."""
+    global _flush_timer
+    with _FLUSH_LOCK:
+        # Snapshot under the index lock, do the slow I/O outside of it
+        with LOCK:
+            if _flush_timer is not None:
+                _flush_timer.cancel()
+                _flush_timer = None
+            payloads = {}
+            for path in _DIRTY:
+                # One unencodable index must not keep the others off disk.
+                # Non-string keys are written as strings, as json.dumps did.
+                try:
+                    payloads[path] = orjson.dumps(
+                        _INDEX_CACHE[path],
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                    )
+                except orjson.JSONEncodeError as e:
+                    print(f"Error encoding index {path}: {e}")
+            _DIRTY.difference_update(payloads)
+
+        failed = _write_index_files(payloads)
+        with LOCK:
+            _DIRTY.update(failed)
+            if not _DIRTY:
+                for directory in {path.parent for path in payloads}:
+                    (directory / DIRTY_MARKER.name).unlink(missing_ok=True)
+
+
+def reload_indexes():
+    """Flush pending changes and drop in-memory indexes (re-read on next use)."""
+    global _sorted_by_created, _ids_by_title, _generation
+    flush_all()
+    with LOCK:
+        # Indexes that failed to flush are lost; the .dirty marker stays
+        # behind, so the next startup regenerates them
+        _DIRTY.clear()
+        _INDEX_CACHE.clear()
+        _BUILT.clear()
+        _generation += 1
+        _POSTINGS.clear()
+        search_index.clear()
+        _sorted_by_created = None
+        _ids_by_title = None
+
+
+# Don't lose debounced writes when run as a script (e.g. regenerate)
+atexit.register(flush_all)
 
 
 # ============================================================================
@@ -34,28 +291,61 @@ def save_index(index_path: Path, data: dict):
 
 def add_to_project_index(project: str, note_id: str):
     """Add note to project index."""
-    index = load_index(PROJECTS_INDEX)
-    if project not in index:
-        index[project] = []
-    if note_id not in index[project]:
-        index[project].append(note_id)
-    save_index(PROJECTS_INDEX, index)
+    project = str(project)  # Hand-written frontmatter may hold e.g. a number
+    with LOCK:
+        index = load_index(PROJECTS_INDEX)
+        if project not in index:
+            index[project] = []
+        if note_id not in index[project]:
+            index[project].append(note_id)
+        save_index(PROJECTS_INDEX, index)
 
 
 def remove_from_project_index(project: str, note_id: str):
     """Remove note from project index."""
-    index = load_index(PROJECTS_INDEX)
-    if project in index and note_id in index[project]:
-        index[project].remove(note_id)
-        if not index[project]:  # Remove empty project lists
-            del index[project]
-        save_index(PROJECTS_INDEX, index)
+    project = str(project)
+    with LOCK:
+        index = load_index(PROJECTS_INDEX)
+        if project in index and note_id in index[project]:
+            index[project].remove(note_id)
+            if not index[project]:  # Remove empty project lists
+                del index[project]
+            save_index(PROJECTS_INDEX, index)
 
 
 def get_notes_by_project(project: str) -> List[str]:
     """Get all note IDs for a project."""
     index = load_index(PROJECTS_INDEX)
-    return index.get(project, [])
+    return list(index.get(project, []))
+
+
+def get_notes_by_project_and_tags(project: str | None, tags: List[str]) -> List[str]:
+    """Get IDs of notes in project (if given) that have all the given tags."""
+    with LOCK:
+        postings = []
+        if project:
+            postings.append(_get_postings(PROJECTS_INDEX).get(project, set()))
+        tag_postings = _get_postings(TAGS_INDEX)
+        postings.extend(tag_postings.get(tag, set()) for tag in tags)
+        if not postings:
+            return []
+
+        # Intersect smallest first to keep intermediate sets small
+        postings.sort(key=len)
+        matched = set.intersection(*postings)
+        return [note_id_for(did) for did in matched]
+
+
+def _get_postings(index_path: Path) -> Dict[str, Set[int]]:
+    """Get a projects/tags index as doc ID sets, building them if needed."""
+    key = index_path.absolute()
+    postings = _POSTINGS.get(key)
+    if postings is None:
+        postings = _POSTINGS[key] = {
+            name: {doc_id(note_id) for note_id in note_ids}
+            for name, note_ids in load_index(index_path).items()
+        }
+    return postings
 
 
 def get_all_projects() -> List[str]:
@@ -72,45 +362,64 @@ def add_to_tags_index(tags: List[str], note_id: str):
     """Add note to tag indexes."""
     if not tags:
         return
-    index = load_index(TAGS_INDEX)
-    for tag in tags:
-        if tag not in index:
-            index[tag] = []
-        if note_id not in index[tag]:
-            index[tag].append(note_id)
-    save_index(TAGS_INDEX, index)
+    with LOCK:
+        index = load_index(TAGS_INDEX)
+        _add_tags(index, tags, note_id)
+        save_index(TAGS_INDEX, index)
 
 
 def remove_from_tags_index(tags: List[str], note_id: str):
     """Remove note from tag indexes."""
     if not tags:
         return
-    index = load_index(TAGS_INDEX)
-    for tag in tags:
-        if tag in index and note_id in index[tag]:
-            index[tag].remove(note_id)
-            if not index[tag]:  # Remove empty tag lists
-                del index[tag]
-    save_index(TAGS_INDEX, index)
+    with LOCK:
+        index = load_index(TAGS_INDEX)
+        _remove_tags(index, tags, note_id)
+        save_index(TAGS_INDEX, index)
 
 
 def update_tags_index(old_tags: List[str], new_tags: List[str], note_id: str):
     """Update tags when note is modified."""
-    # Remove from tags that are no longer present
-    removed_tags = set(old_tags) - set(new_tags)
-    if removed_tags:
-        remove_from_tags_index(list(removed_tags), note_id)
+    if old_tags == new_tags:
+        return
+
+    old_set = frozenset(old_tags)
+    new_set = frozenset(new_tags)
+    removed_tags = old_set - new_set
+    added_tags = new_set - old_set
+    if not removed_tags and not added_tags:
+        return
+
+    # Apply both sides of the diff in a single index update
+    with LOCK:
+        index = load_index(TAGS_INDEX)
+        _remove_tags(index, removed_tags, note_id)
+        _add_tags(index, added_tags, note_id)
+        save_index(TAGS_INDEX, index)
+
+
+def _add_tags(index: dict, tags, note_id: str):
+    """Add note to the given tags in a loaded tags index."""
+    for tag in map(str, tags):  # Index keys must be strings
+        if tag not in index:
+            index[tag] = []
+        if note_id not in index[tag]:
+            index[tag].append(note_id)
 
-    # Add to new tags
-    added_tags = set(new_tags) - set(old_tags)
-    if added_tags:
-        add_to_tags_index(list(added_tags), note_id)
+
+def _remove_tags(index: dict, tags, note_id: str):
+    """Remove note from the given tags in a loaded tags index."""
+    for tag in map(str, tags):
+        if tag in index and note_id in index[tag]:
+            index[tag].remove(note_id)
+            if not index[tag]:  # Remove empty tag lists
+                del index[tag]
 
 
 def get_notes_by_tag(tag: str) -> List[str]:
     """Get all note IDs for a tag."""
     index = load_index(TAGS_INDEX)
-    return index.get(tag, [])
+    return list(index.get(tag, []))
 
 
 def get_all_tags() -> List[str]:
@@ -133,35 +442,103 @@ def add_to_metadata_index(
     project: str,
     content_type: str,
     tags: List[str],
+    user: str | None = None,
 ):
     """Add note metadata to index."""
-    index = load_index(METADATA_INDEX)
-    index[note_id] = {
+    global _ids_by_title
+    with LOCK:
+        index = load_index(METADATA_INDEX)
+        if note_id in index:
+            _unsort(note_id, index[note_id])
+        index[note_id] = metadata_entry(
+            title, created, modified, file_path, project, content_type, tags, user
+        )
+        save_index(METADATA_INDEX, index)
+        _sort_in(note_id, index[note_id])
+        _ids_by_title = None
+        if search_index.is_built():
+            search_index.add(doc_id(note_id), title)
+
+
+def metadata_entry(
+    title: str,
+    created: str,
+    modified: str,
+    file_path: str,
+    project: str,
+    content_type: str,
+    tags: List[str],
+    user: str | None = None,
+) -> dict:
+    """Build a note's metadata index record."""
+    return {
         "title": title,
-        "created": created,
-        "modified": modified,
+        "title_lower": title.lower(),
+        "created": _timestamp(created),
+        "modified": _timestamp(modified),
         "file_path": file_path,
         "project": project,
         "type": content_type,
         "tags": tags,
+        "user": user,
     }
-    save_index(METADATA_INDEX, index)
+
+
+def replace_note_indexes(projects: dict, tags: dict, metadata: dict):
+    """Replace the projects, tags and metadata indexes wholesale (for regeneration)."""
+    global _sorted_by_created, _ids_by_title
+    with LOCK:
+        save_index(PROJECTS_INDEX, projects)
+        save_index(TAGS_INDEX, tags)
+        save_index(METADATA_INDEX, metadata)
+        search_index.clear()
+        _sorted_by_created = None
+        _ids_by_title = None
+
+
+def _timestamp(value) -> str:
+    """Store a timestamp as text; YAML frontmatter may parse it to a datetime."""
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
 
 
 def update_metadata_index(note_id: str, **kwargs):
     """Update metadata for a note."""
-    index = load_index(METADATA_INDEX)
-    if note_id in index:
-        index[note_id].update(kwargs)
-        save_index(METADATA_INDEX, index)
+    global _ids_by_title
+    if "title" in kwargs:
+        kwargs["title_lower"] = kwargs["title"].lower()
+    for key in ("created", "modified"):
+        if key in kwargs:
+            kwargs[key] = _timestamp(kwargs[key])
+    with LOCK:
+        index = load_index(METADATA_INDEX)
+        if note_id in index:
+            if "created" in kwargs:
+                _unsort(note_id, index[note_id])
+            index[note_id].update(kwargs)
+            save_index(METADATA_INDEX, index)
+            if "created" in kwargs:
+                _sort_in(note_id, index[note_id])
+            if "title" in kwargs or "created" in kwargs:
+                _ids_by_title = None
+            if "title" in kwargs and search_index.is_built():
+                search_index.add(doc_id(note_id), kwargs["title"])
 
 
 def remove_from_metadata_index(note_id: str):
     """Remove note from metadata index."""
-    index = load_index(METADATA_INDEX)
-    if note_id in index:
-        del index[note_id]
-        save_index(METADATA_INDEX, index)
+    global _ids_by_title
+    with LOCK:
+        index = load_index(METADATA_INDEX)
+        if note_id in index:
+            _unsort(note_id, index.pop(note_id))
+            save_index(METADATA_INDEX, index)
+            _ids_by_title = None
+            if search_index.is_built():
+                search_index.remove(doc_id(note_id))
 
 
 def get_note_metadata(note_id: str) -> dict | None:
@@ -173,21 +550,101 @@ def get_note_metadata(note_id: str) -> dict | None:
     return None
 
 
+def get_metadata_batch(note_ids: List[str]) -> List[dict]:
+    """Get metadata for several notes, skipping IDs not in the index."""
+    index = load_index(METADATA_INDEX)
+    return [
+        {"id": note_id, **index[note_id]}
+        for note_id in note_ids
+        if note_id in index
+    ]
+
+
+def search_titles(query: str, limit: int = 50) -> List[str]:
+    """Get IDs of up to limit notes whose title contains query (case-insensitive), newest first."""
+    with LOCK:
+        index = load_index(METADATA_INDEX)
+        if not search_index.is_built():
+            search_index.build(
+                (doc_id(note_id), meta.get("title", "")) for note_id, meta in index.items()
+            )
+        matches = [
+            (index[note_id].get("created", ""), note_id)
+            for note_id in map(note_id_for, search_index.search(query))
+        ]
+    return [note_id for _, note_id in heapq.nlargest(limit, matches)]
+
+
+def get_note_id_by_title(title: str) -> str | None:
+    """Find note ID by title (case-insensitive); the newest note wins."""
+    global _ids_by_title
+    with LOCK:
+        if _ids_by_title is None:
+            index = load_index(METADATA_INDEX)
+            # Walk oldest to newest so newer notes overwrite older ones
+            _ids_by_title = {
+                index[note_id].get("title_lower") or index[note_id].get("title", "").lower(): note_id
+                for _, note_id in _get_sorted_by_created()
+            }
+        return _ids_by_title.get(title.lower())
+
+
 def get_all_metadata(limit: int = 100, offset: int = 0) -> List[dict]:
     """Get all note metadata, sorted by created date (newest first)."""
-    index = load_index(METADATA_INDEX)
+    with LOCK:
+        index = load_index(METADATA_INDEX)
+        order = _get_sorted_by_created()
 
-    # Convert to list with IDs
-    metadata_list = [
-        {"id": note_id, **meta}
-        for note_id, meta in index.items()
-    ]
+        # The order is ascending, so the newest page is sliced from the end
+        end = len(order) - offset
+        if end <= 0:
+            return []
+        page = order[max(end - limit, 0):end]
+
+        return [{"id": note_id, **index[note_id]} for _, note_id in reversed(page)]
+
+
+def get_metadata_page(note_ids: List[str], limit: int = 100, offset: int = 0) -> List[dict]:
+    """Get one page of metadata for the given notes, sorted by created date (newest first)."""
+    with LOCK:
+        index = load_index(METADATA_INDEX)
+        # Partial sort on bare keys; only the page gets full dicts
+        keys = heapq.nlargest(
+            offset + limit,
+            (_sort_key(note_id, index[note_id]) for note_id in note_ids if note_id in index),
+        )
+        return [{"id": note_id, **index[note_id]} for _, note_id in keys[offset:]]
+
+
+def _sort_key(note_id: str, meta: dict) -> tuple:
+    """Position of a note in the created-date order."""
+    return (meta.get("created") or "", note_id)
+
+
+def _get_sorted_by_created() -> List[tuple]:
+    """Get the created-date order, building it from the index if needed."""
+    global _sorted_by_created
+    if _sorted_by_created is None:
+        index = load_index(METADATA_INDEX)
+        _sorted_by_created = sorted(
+            _sort_key(note_id, meta) for note_id, meta in index.items()
+        )
+    return _sorted_by_created
+
+
+def _sort_in(note_id: str, meta: dict):
+    """Insert a note into the created-date order (if it has been built)."""
+    if _sorted_by_created is not None:
+        bisect.insort(_sorted_by_created, _sort_key(note_id, meta))
 
-    # Sort by created date (newest first)
-    metadata_list.sort(key=lambda x: x.get("created", ""), reverse=True)
 
-    # Apply pagination
-    return metadata_list[offset:offset + limit]
+def _unsort(note_id: str, meta: dict):
+    """Remove a note from the created-date order (if it has been built)."""
+    if _sorted_by_created is not None:
+        key = _sort_key(note_id, meta)
+        i = bisect.bisect_left(_sorted_by_created, key)
+        if i < len(_sorted_by_created) and _sorted_by_created[i] == key:
+            del _sorted_by_created[i]
 
 
 # ============================================================================
@@ -195,6 +652,24 @@ def get_all_metadata(limit: int = 100, offset: int = 0) -> List[dict]:
 # ============================================================================
 
 def clear_all_indexes():
-    """Clear all index files (useful for regeneration)."""
-    for index_file in INDEXES_DIR.glob("*.json"):
-        index_file.write_text("{}")
+    """Clear all note index files (useful for regeneration)."""
+    global _sorted_by_created, _ids_by_title, _generation
+    # The flush lock keeps a running flush off the same temp files; taken
+    # before LOCK, in the same order as flush_all
+    with _FLUSH_LOCK, LOCK:
+        for index_path in NOTE_INDEXES:
+            key = index_path.absolute()
+            if key in _INDEX_CACHE:
+                _INDEX_CACHE[key] = {}
+            _DIRTY.discard(key)
+        _BUILT.clear()
+        _POSTINGS.clear()
+        search_index.clear()
+        _sorted_by_created = None
+        _ids_by_title = None
+        _generation += 1
+        INDEXES_DIR.mkdir(exist_ok=True)
+        for index_path in NOTE_INDEXES:
+            write_file_atomic(index_path, b"{}")
+        if not _DIRTY:
+            DIRTY_MARKER.unlink(missing_ok=True)
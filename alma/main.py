@@ -1,6 +1,8 @@
 """Main FastAPI application for the note-taking app."""
 
 import os
+import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Annotated
 
@@ -15,6 +17,8 @@ from .auth import (
     exchange_code_for_token,
     get_user_info,
     create_session_cookie,
+    close_http_client,
+    auth_middleware,
     require_auth,
     validate_config,
 )
@@ -23,40 +27,74 @@ from . import notes, indexes, projects
 # Load environment variables
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Validate configuration on startup; write pending changes on shutdown."""
+    try:
+        validate_config()
+        print("✓ Configuration validated successfully")
+    except ValueError as e:
+        print(f"\n❌ Configuration Error:\n{e}\n")
+        raise
+
+    # Ensure required directories exist (notes/default for the default project)
+    for directory in (Path("notes/default"), Path(".indexes")):
+        if not directory.exists():
+            directory.mkdir(parents=True, exist_ok=True)
+
+    # Index changes are flushed lazily; recover if the last run didn't flush
+    if indexes.needs_recovery():
+        from .regenerate import regenerate_all_indexes
+        print("⚠️  Indexes were not flushed on last shutdown, regenerating...")
+        regenerate_all_indexes()
+
+    yield
+
+    indexes.flush_all()
+    await close_http_client()
+
+
 # Initialize FastAPI app
-app = FastAPI(title="Notes App")
+app = FastAPI(title="Notes App", lifespan=lifespan)
+app.middleware("http")(auth_middleware)
+
+
+
+class CachedStaticFiles(StaticFiles):
+    """Static files that browsers may reuse for a day without revalidating."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=86400"
+        return response
+
 
 # Mount static files
 static_dir = Path(__file__).parent / "static"
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+app.mount("/static", CachedStaticFiles(directory=str(static_dir)), name="static")
 
 # Setup templates
 templates_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(templates_dir))
 
-# Ensure required directories exist
-Path("notes").mkdir(parents=True, exist_ok=True)
-Path(".indexes").mkdir(exist_ok=True)
+# Rendered login page, keyed by whether it shows the error message
+_login_pages: dict[bool, str] = {}
 
-# Initialize default project on first run
-default_project_dir = Path("notes/default")
-default_project_dir.mkdir(parents=True, exist_ok=True)
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Validate configuration on startup."""
-    try:
-        validate_config()
-        print("✓ Configuration validated successfully")
-    except ValueError as e:
-        print(f"\n❌ Configuration Error:\n{e}\n")
-        raise
+# Part of every ETag, so tags handed out by an earlier run never match
+_ETAG_SEED = uuid.uuid4().hex[:8]
 
 
 @app.get("/")
 async def index(request: Request, user: str = Depends(require_auth)):
     """Main app page - requires authentication."""
+    # Taken before rendering, so a concurrent change can only cause a re-render
+    version = hash((indexes.generation(), projects.config_version(), user))
+    etag = f'W/"{_ETAG_SEED}-{version & 0xFFFFFFFFFFFFFFFF:x}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
     notes_list = notes.list_notes(limit=20)
     all_tags = indexes.get_all_tags()
 
@@ -73,7 +111,8 @@ async def index(request: Request, user: str = Depends(require_auth)):
             "tags": all_tags,
             "projects_list": projects_list,
             "total_count": total_count
-        }
+        },
+        headers=headers,
     )
 
 
@@ -148,10 +187,12 @@ async def create_note_from_editor(
 @app.get("/login")
 async def login_page(request: Request):
     """Show login page with Google OAuth button."""
-    return templates.TemplateResponse(
-        "login.html",
-        {"request": request}
-    )
+    # The page only varies with the error flag, so each variant renders once
+    has_error = bool(request.query_params.get("error"))
+    html = _login_pages.get(has_error)
+    if html is None:
+        html = _login_pages[has_error] = templates.get_template("login.html").render(request=request)
+    return HTMLResponse(html, headers={"Cache-Control": "public, max-age=3600"})
 
 
 @app.get("/auth/google")
@@ -310,31 +351,25 @@ async def filter_notes(
     limit: int = 20,
     user: str = Depends(require_auth)
 ):
-    """Filter notes by project or tag, return HTML fragment."""
-    notes_list = []
-
+    """Filter notes by project and/or tag, return HTML fragment."""
     if filter == "all":
-        # Show all notes
-        metadata = indexes.get_all_metadata(limit=limit+offset+10)
-        note_ids = [m["id"] for m in metadata[offset:offset+limit]]
-        notes_list = [notes.get_note(nid) for nid in note_ids if notes.get_note(nid)]
+        note_ids = None
+    elif project and tag:
+        note_ids = indexes.get_notes_by_project_and_tags(project, [tag])
     elif project:
-        # Filter by project
         note_ids = indexes.get_notes_by_project(project)
-        notes_list = [notes.get_note(nid) for nid in note_ids[offset:offset+limit] if notes.get_note(nid)]
-        # Sort by created date
-        notes_list.sort(key=lambda n: n.get("created", ""), reverse=True)
     elif tag:
-        # Filter by tag
         note_ids = indexes.get_notes_by_tag(tag)
-        notes_list = [notes.get_note(nid) for nid in note_ids[offset:offset+limit] if notes.get_note(nid)]
-        # Sort by created date
-        notes_list.sort(key=lambda n: n.get("created", ""), reverse=True)
     else:
-        # Default: show all
-        metadata = indexes.get_all_metadata(limit=limit+offset+10)
-        note_ids = [m["id"] for m in metadata[offset:offset+limit]]
-        notes_list = [notes.get_note(nid) for nid in note_ids if notes.get_note(nid)]
+        note_ids = None
+
+    if note_ids is None:
+        # Show all notes
+        page = indexes.get_all_metadata(limit=limit, offset=offset)
+    else:
+        page = indexes.get_metadata_page(note_ids, limit=limit, offset=offset)
+
+    notes_list = notes.get_notes([m["id"] for m in page])
 
     # Check if there are more notes to load
     has_more = len(notes_list) == limit
@@ -356,17 +391,11 @@ async def search_notes(
         # Empty search - show all notes
         metadata = indexes.get_all_metadata(limit=50)
         note_ids = [m["id"] for m in metadata]
-        notes_list = [notes.get_note(nid) for nid in note_ids if notes.get_note(nid)]
     else:
-        # Search in metadata titles
-        query_lower = q.lower()
-        all_metadata = indexes.get_all_metadata(limit=500)
-        matching_ids = [
-            meta["id"]
-            for meta in all_metadata
-            if query_lower in meta.get("title", "").lower()
-        ]
-        notes_list = [notes.get_note(nid) for nid in matching_ids if notes.get_note(nid)]
+        # Search in metadata titles; only one page of notes is loaded
+        note_ids = indexes.search_titles(q, limit=50)
+
+    notes_list = notes.get_notes(note_ids)
 
     return templates.TemplateResponse(
         "partials/note-list-only.html",
@@ -1,11 +1,16 @@
 """Notes CRUD module - manages markdown files with frontmatter."""
 
+import mmap
+import os
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Any, List
 
 import frontmatter
+import orjson
+from frontmatter.default_handlers import YAMLHandler
 from slugify import slugify
 
 from . import indexes, wiki_links
@@ -13,6 +18,37 @@ from . import indexes, wiki_links
 NOTES_DIR = Path("notes")
 
 
+class JSONFrontmatterHandler(YAMLHandler):
+    """Frontmatter handler that writes metadata as JSON between --- delimiters.
+
+    JSON is a subset of YAML, so files stay readable by any YAML frontmatter
+    tool, but the app writes and reads its own notes with orjson. Existing
+    YAML frontmatter is still parsed as YAML.
+    """
+
+    def load(self, fm: str, **kwargs: object) -> Any:
+        fm = fm.strip()
+        if fm.startswith("{"):
+            try:
+                return orjson.loads(fm)
+            except orjson.JSONDecodeError:
+                pass  # A YAML flow mapping rather than strict JSON
+        return super().load(fm, **kwargs)
+
+    def export(self, metadata: dict[str, object], **kwargs: object) -> str:
+        return orjson.dumps(
+            metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+
+# Used to write notes and to split off or parse the frontmatter block
+_FRONTMATTER_HANDLER = JSONFrontmatterHandler()
+
+# Recently read note bodies: absolute path -> (mtime_ns, content), LRU-bounded
+_NOTE_CACHE: OrderedDict[str, tuple[int, str]] = OrderedDict()
+_NOTE_CACHE_SIZE = 2048
+
+
 def create_note(
     content: str,
     project: str,
@@ -56,18 +92,19 @@ def create_note(
 
     # Write file
     with open(file_path, "w", encoding="utf-8") as f:
-        f.write(frontmatter.dumps(post))
-
-    # Update indexes synchronously
-    indexes.add_to_project_index(project, note_id)
-    indexes.add_to_tags_index(tags, note_id)
-    indexes.add_to_metadata_index(
-        note_id, title, created, modified, str(file_path), project, content_type, tags
-    )
+        f.write(frontmatter.dumps(post, handler=_FRONTMATTER_HANDLER))
 
-    # Extract and index wiki-links
+    # Extract wiki-links before taking the index lock
     links = wiki_links.extract_wiki_links(content)
-    wiki_links.add_wiki_links_to_index(note_id, links)
+
+    # Update indexes as one batch
+    with indexes.batch():
+        indexes.add_to_project_index(project, note_id)
+        indexes.add_to_tags_index(tags, note_id)
+        indexes.add_to_metadata_index(
+            note_id, title, created, modified, str(file_path), project, content_type, tags, user
+        )
+        wiki_links.add_wiki_links_to_index(note_id, links)
 
     # Return note dict
     return {
@@ -85,16 +122,42 @@ def create_note(
 
 
 def get_note(note_id: str) -> dict | None:
-    """Load note from file by ID."""
+    """Load note by ID: metadata from the index, body from the file."""
+    metadata = indexes.get_note_metadata(note_id)
+    if metadata:
+        return _load_indexed_note(metadata)
+
+    # Not indexed (e.g. added outside the app): parse the file itself
     file_path = _find_file_by_id(note_id)
     if not file_path:
         return None
+    post = frontmatter.load(file_path, handler=_FRONTMATTER_HANDLER)
+    return _build_note(post.metadata, post.content, file_path)
+
+
+def get_notes(note_ids: List[str]) -> List[dict]:
+    """Load several notes by ID, in order, skipping IDs that don't resolve."""
+    notes = []
+    for metadata in indexes.get_metadata_batch(note_ids):
+        note = _load_indexed_note(metadata)
+        if note:
+            notes.append(note)
+    return notes
+
+
+def _load_indexed_note(metadata: dict) -> dict | None:
+    """Build a note from its index metadata, reading only the body from disk."""
+    file_path = Path(metadata["file_path"])
+    try:
+        content = _read_content(file_path)
+    except FileNotFoundError:
+        return None
+    return _build_note(metadata, content, file_path)
 
-    post = frontmatter.load(file_path)
-    metadata = post.metadata
 
+def _build_note(metadata: dict, content: str, file_path: Path) -> dict:
+    """Assemble the note dict returned to callers."""
     title = metadata.get("title", "Untitled")
-    content = post.content
 
     # Get backlinks for this note
     backlinks = wiki_links.get_backlinks(title)
@@ -116,46 +179,15 @@ def get_note(note_id: str) -> dict | None:
 
 
 def list_notes(project: str | None = None, limit: int = 50) -> List[dict]:
-    """List notes, optionally filtered by project."""
-    notes = []
-
-    # Determine which directories to search
+    """List notes (newest first), optionally filtered by project."""
     if project:
-        search_dirs = [NOTES_DIR / project]
+        note_ids = indexes.get_notes_by_project(project)
+        metadata = indexes.get_metadata_page(note_ids, limit=limit)
     else:
-        # Search all project directories
-        search_dirs = [d for d in NOTES_DIR.iterdir() if d.is_dir()]
-
-    # Find all markdown files
-    for search_dir in search_dirs:
-        if not search_dir.exists():
-            continue
+        metadata = indexes.get_all_metadata(limit=limit)
 
-        for md_file in search_dir.glob("*.md"):
-            try:
-                post = frontmatter.load(md_file)
-                metadata = post.metadata
-
-                notes.append({
-                    "id": metadata.get("id"),
-                    "title": metadata.get("title"),
-                    "content": post.content,
-                    "created": metadata.get("created"),
-                    "modified": metadata.get("modified"),
-                    "project": metadata.get("project"),
-                    "type": metadata.get("type"),
-                    "tags": metadata.get("tags", []),
-                    "user": metadata.get("user"),
-                    "file_path": str(md_file),
-                })
-            except Exception as e:
-                print(f"Error loading {md_file}: {e}")
-                continue
-
-    # Sort by created date (newest first)
-    notes.sort(key=lambda n: n.get("created", ""), reverse=True)
-
-    return notes[:limit]
+    # Only the listed notes' files are opened
+    return get_notes([m["id"] for m in metadata])
 
 
 def update_note(note_id: str, content: str, tags: List[str]) -> dict:
@@ -165,7 +197,7 @@ def update_note(note_id: str, content: str, tags: List[str]) -> dict:
         raise ValueError(f"Note {note_id} not found")
 
     # Load existing note
-    post = frontmatter.load(file_path)
+    post = frontmatter.load(file_path, handler=_FRONTMATTER_HANDLER)
 
     # Get old values for index updates
     old_tags = post.metadata.get("tags", [])
@@ -185,16 +217,15 @@ def update_note(note_id: str, content: str, tags: List[str]) -> dict:
 
     # Write updated file
     with open(file_path, "w", encoding="utf-8") as f:
-        f.write(frontmatter.dumps(post))
-
-    # Update indexes
-    if set(old_tags) != set(tags):
-        indexes.update_tags_index(old_tags, tags, note_id)
-    indexes.update_metadata_index(note_id, modified=modified, title=title, tags=tags)
+        f.write(frontmatter.dumps(post, handler=_FRONTMATTER_HANDLER))
+    _forget_content(file_path)
 
-    # Update wiki-links index
+    # Update indexes (including wiki-links) as one batch
     links = wiki_links.extract_wiki_links(content)
-    wiki_links.add_wiki_links_to_index(note_id, links)
+    with indexes.batch():
+        indexes.update_tags_index(old_tags, tags, note_id)
+        indexes.update_metadata_index(note_id, modified=modified, title=title, tags=tags)
+        wiki_links.add_wiki_links_to_index(note_id, links)
 
     # Return updated note
     return get_note(note_id)
@@ -209,14 +240,16 @@ def delete_note(note_id: str) -> bool:
 
     file_path = Path(note["file_path"])
 
-    # Remove from indexes
-    indexes.remove_from_project_index(note["project"], note_id)
-    indexes.remove_from_tags_index(note.get("tags", []), note_id)
-    indexes.remove_from_metadata_index(note_id)
-    wiki_links.remove_wiki_links_from_index(note_id)
+    # Remove from indexes as one batch
+    with indexes.batch():
+        indexes.remove_from_project_index(note["project"], note_id)
+        indexes.remove_from_tags_index(note.get("tags", []), note_id)
+        indexes.remove_from_metadata_index(note_id)
+        wiki_links.remove_wiki_links_from_index(note_id)
 
     # Delete file
     file_path.unlink()
+    _forget_content(file_path)
     return True
 
 
@@ -229,15 +262,106 @@ def _generate_filename(title: str) -> str:
     return f"{timestamp}-{slug}.md"
 
 
+def _read_content(file_path: Path) -> str:
+    """Read note body, cached until the file's mtime changes."""
+    key = os.path.abspath(file_path)
+    mtime = os.stat(key).st_mtime_ns
+
+    cached = _NOTE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        _NOTE_CACHE.move_to_end(key)
+        return cached[1]
+
+    content = _split_content(file_path)
+    _NOTE_CACHE[key] = (mtime, content)
+    _NOTE_CACHE.move_to_end(key)
+    if len(_NOTE_CACHE) > _NOTE_CACHE_SIZE:
+        _NOTE_CACHE.popitem(last=False)
+    return content
+
+
+def _forget_content(file_path: Path):
+    """Drop a note body from the cache after the app rewrites or deletes it."""
+    _NOTE_CACHE.pop(os.path.abspath(file_path), None)
+
+
+def _split_content(file_path: Path) -> str:
+    """Read note body, skipping the frontmatter block without parsing it."""
+    text = file_path.read_text(encoding="utf-8").strip()
+    if not _FRONTMATTER_HANDLER.detect(text):
+        return text
+    try:
+        _, content = _FRONTMATTER_HANDLER.split(text)
+    except ValueError:
+        return text
+    return content.strip()
+
+
+def read_note_file(file_path: Path) -> tuple[dict, str]:
+    """Read a note file once, returning its frontmatter and body.
+
+    Lighter than frontmatter.load: the handler is known, so there's no
+    format detection, and JSON frontmatter is parsed with orjson.
+    """
+    text = Path(file_path).read_text(encoding="utf-8").strip()
+    if not _FRONTMATTER_HANDLER.detect(text):
+        return {}, text
+    try:
+        header, content = _FRONTMATTER_HANDLER.split(text)
+    except ValueError:
+        return {}, text
+    metadata = _FRONTMATTER_HANDLER.load(header)
+    return (metadata if isinstance(metadata, dict) else {}), content.strip()
+
+
+def _read_frontmatter_only(path: Path) -> dict:
+    """Parse only the frontmatter block, without reading or decoding the body."""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can't be mapped
+            return {}
+        with mm:
+            if mm[:3] != b"---":
+                return {}
+            end = mm.find(b"\n---", 3)
+            if end == -1:
+                return {}
+            header = mm[3:end]
+
+    metadata = _FRONTMATTER_HANDLER.load(header.decode("utf-8"))
+    return metadata if isinstance(metadata, dict) else {}
+
+
 def _find_file_by_id(note_id: str) -> Path | None:
-    """Find note file by searching for ID in frontmatter."""
-    # Search all project directories
-    for md_file in NOTES_DIR.rglob("*.md"):
+    """Find note file via the metadata index, scanning frontmatter as a fallback."""
+    metadata = indexes.get_note_metadata(note_id)
+    if metadata:
+        return Path(metadata["file_path"])
+
+    # Not indexed: search all project directories
+    for md_file in iter_note_files(NOTES_DIR):
         try:
-            post = frontmatter.load(md_file)
-            if post.metadata.get("id") == note_id:
-                return md_file
+            if _read_frontmatter_only(md_file).get("id") == note_id:
+                return Path(md_file)
         except Exception:
             continue
 
     return None
+
+
+def iter_note_files(directory: Path | str):
+    """Yield paths of all markdown files below directory.
+
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so no extra stat is needed per entry.
+    """
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_note_files(entry.path)
+        elif entry.name.endswith(".md") and entry.is_file():
+            yield entry.path
@@ -1,9 +1,13 @@
 """Project management module."""
 
-import json
+import copy
+from collections import OrderedDict
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Dict
 from datetime import datetime
+
+import orjson
 from slugify import slugify
 
 from . import indexes
@@ -11,41 +15,96 @@ from . import indexes
 INDEXES_DIR = Path(".indexes")
 PROJECTS_CONFIG = INDEXES_DIR / "projects_config.json"
 
-# Single default project that ships with the app
-DEFAULT_PROJECT = {
+# Colors a project can be given
+_VALID_COLORS = frozenset({"blue", "green", "purple", "orange", "red", "gray", "pink", "yellow"})
+
+# Single default project that ships with the app (read-only; copy with dict())
+DEFAULT_PROJECT = MappingProxyType({
     "id": "default",
     "name": "Default",
     "color": "blue",
     "description": "Default project for all notes",
     "is_default": True,
     "created": datetime.now().isoformat(),
-}
+})
+
+# Projects map used while there is no config file; shared like the cache
+_DEFAULT_ONLY = OrderedDict(default=dict(DEFAULT_PROJECT))
+
+# Parsed projects config as an id -> project OrderedDict, reused while the
+# file's path, mtime and size are unchanged
+_config_cache = {"path": None, "stamp": None, "data": None}
+
+# Note count per project ID, valid for one indexes.generation()
+_counts_cache = {"generation": None, "counts": {}}
+
+
+def _config_stamp() -> tuple:
+    """Get (mtime_ns, size) of the config file; raises if it doesn't exist."""
+    stat = PROJECTS_CONFIG.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def config_version() -> tuple | None:
+    """Get a value that changes whenever the projects config file does."""
+    try:
+        return _config_stamp()
+    except FileNotFoundError:
+        return None
 
 
 def load_projects_config() -> List[Dict]:
-    """Load projects configuration from JSON."""
-    if not PROJECTS_CONFIG.exists():
+    """Load projects configuration from JSON (cached until the file changes)."""
+    # Callers mutate the projects they get back
+    return copy.deepcopy(list(_load_projects_by_id().values()))
+
+
+def _load_projects_by_id() -> OrderedDict:
+    """Get the cached id -> project map. Shared; callers must not mutate it."""
+    try:
+        stamp = _config_stamp()
+    except FileNotFoundError:
         # Initialize with default project
-        return [DEFAULT_PROJECT.copy()]
+        return _DEFAULT_ONLY
+
+    path = PROJECTS_CONFIG.absolute()
+    if _config_cache["path"] != path or _config_cache["stamp"] != stamp:
+        _config_cache.update(path=path, stamp=stamp, data=_by_id(_read_projects_config()))
+    return _config_cache["data"]
 
+
+def _by_id(projects: List[Dict]) -> OrderedDict:
+    """Index a projects list by project ID, keeping its order (entries without one are dropped)."""
+    return OrderedDict((p["id"], p) for p in projects if "id" in p)
+
+
+def _read_projects_config() -> List[Dict]:
+    """Read and parse the projects configuration file."""
     try:
-        data = json.loads(PROJECTS_CONFIG.read_text())
+        data = orjson.loads(PROJECTS_CONFIG.read_bytes())
         projects = data.get("projects", [])
 
         # Ensure default project always exists
-        has_default = any(p.get("id") == "default" for p in projects)
+        has_default = any(p["id"] == "default" for p in projects if "id" in p)
         if not has_default:
-            projects.insert(0, DEFAULT_PROJECT.copy())
+            projects.insert(0, dict(DEFAULT_PROJECT))
 
         return projects
-    except (json.JSONDecodeError, IOError):
-        return [DEFAULT_PROJECT.copy()]
+    except (orjson.JSONDecodeError, IOError):
+        return [dict(DEFAULT_PROJECT)]
 
 
 def save_projects_config(projects: List[Dict]):
     """Save projects configuration to JSON."""
     data = {"projects": projects}
-    PROJECTS_CONFIG.write_text(json.dumps(data, indent=2))
+    indexes.write_file_atomic(PROJECTS_CONFIG, orjson.dumps(data))
+
+    # Refresh the cache so the next load doesn't re-read what was just written
+    _config_cache.update(
+        path=PROJECTS_CONFIG.absolute(),
+        stamp=_config_stamp(),
+        data=_by_id(copy.deepcopy(projects)),
+    )
 
 
 def get_all_projects() -> List[Dict]:
@@ -53,14 +112,26 @@ def get_all_projects() -> List[Dict]:
     projects = load_projects_config()
 
     # Add note counts from index
-    projects_index = indexes.load_index(indexes.PROJECTS_INDEX)
+    counts = _note_counts()
     for project in projects:
-        note_ids = projects_index.get(project["id"], [])
-        project["note_count"] = len(note_ids)
+        project["note_count"] = counts.get(project["id"], 0)
 
     return projects
 
 
+def _note_counts() -> Dict[str, int]:
+    """Get note count per project, recounted only after the indexes change."""
+    with indexes.LOCK:
+        projects_index = indexes.load_index(indexes.PROJECTS_INDEX)
+        generation = indexes.generation()
+        if _counts_cache["generation"] != generation:
+            _counts_cache.update(
+                generation=generation,
+                counts={pid: len(note_ids) for pid, note_ids in projects_index.items()},
+            )
+        return _counts_cache["counts"]
+
+
 def create_project(name: str, color: str = "gray", description: str = "") -> Dict:
     """Create a new project."""
     # Generate ID from name
@@ -69,15 +140,14 @@ def create_project(name: str, color: str = "gray", description: str = "") -> Dic
         raise ValueError("Invalid project name")
 
     # Load existing projects
-    projects = load_projects_config()
+    projects_by_id = _load_projects_by_id()
 
     # Check for duplicate ID
-    if any(p.get("id") == project_id for p in projects):
+    if project_id in projects_by_id:
         raise ValueError(f"Project '{name}' already exists")
 
     # Validate color
-    valid_colors = ["blue", "green", "purple", "orange", "red", "gray", "pink", "yellow"]
-    if color not in valid_colors:
+    if color not in _VALID_COLORS:
         color = "gray"
 
     # Create project
@@ -91,8 +161,7 @@ def create_project(name: str, color: str = "gray", description: str = "") -> Dic
     }
 
     # Add to list and save
-    projects.append(project)
-    save_projects_config(projects)
+    save_projects_config([*projects_by_id.values(), project])
 
     # Create directory
     project_dir = Path("notes") / project_id
@@ -103,15 +172,7 @@ def create_project(name: str, color: str = "gray", description: str = "") -> Dic
 
 def update_project(project_id: str, name: str = None, color: str = None, description: str = None) -> Dict:
     """Update project metadata."""
-    projects = load_projects_config()
-
-    # Find project
-    project = None
-    for p in projects:
-        if p.get("id") == project_id:
-            project = p
-            break
-
+    project = get_project(project_id)
     if not project:
         raise ValueError(f"Project '{project_id}' not found")
 
@@ -119,8 +180,7 @@ def update_project(project_id: str, name: str = None, color: str = None, descrip
     if name is not None:
         project["name"] = name
     if color is not None:
-        valid_colors = ["blue", "green", "purple", "orange", "red", "gray", "pink", "yellow"]
-        if color in valid_colors:
+        if color in _VALID_COLORS:
             project["color"] = color
     if description is not None:
         project["description"] = description
@@ -128,7 +188,10 @@ def update_project(project_id: str, name: str = None, color: str = None, descrip
     project["modified"] = datetime.now().isoformat()
 
     # Save
-    save_projects_config(projects)
+    projects_by_id = _load_projects_by_id()
+    save_projects_config([
+        project if pid == project_id else p for pid, p in projects_by_id.items()
+    ])
 
     return project
 
@@ -136,15 +199,10 @@ def update_project(project_id: str, name: str = None, color: str = None, descrip
 def delete_project(project_id: str) -> bool:
     """Delete a project (must be empty and not default)."""
     # Load projects config first
-    projects = load_projects_config()
+    projects_by_id = _load_projects_by_id()
 
     # Check if project exists
-    project = None
-    for p in projects:
-        if p.get("id") == project_id:
-            project = p
-            break
-
+    project = projects_by_id.get(project_id)
     if not project:
         raise ValueError(f"Project '{project_id}' not found")
 
@@ -159,21 +217,17 @@ def delete_project(project_id: str) -> bool:
         raise ValueError(f"Cannot delete project with {len(note_ids)} notes. Move notes first.")
 
     # Remove from config
-    projects = [p for p in projects if p.get("id") != project_id]
-    save_projects_config(projects)
+    save_projects_config([p for pid, p in projects_by_id.items() if pid != project_id])
 
     return True
 
 
 def get_project(project_id: str) -> Dict | None:
     """Get single project by ID."""
-    projects = load_projects_config()
-    for p in projects:
-        if p.get("id") == project_id:
-            return p
-    return None
+    project = _load_projects_by_id().get(project_id)
+    return copy.deepcopy(project) if project else None
 
 
 def project_exists(project_id: str) -> bool:
     """Check if project exists."""
-    return get_project(project_id) is not None
+    return project_id in _load_projects_by_id()
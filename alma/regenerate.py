@@ -6,23 +6,56 @@ Run this script after:
 - Index corruption or issues
 - Initial setup with existing notes
 
-Usage:
+While the server is running, regenerate through it instead:
+    POST /admin/regenerate
+
+The server keeps the indexes in memory and writes them back lazily, so it
+never sees a rebuild done by another process and its next flush would
+overwrite the result. Running this script against a live server is not
+supported.
+
+Usage (server stopped):
     uv run python -m alma.regenerate
     or
     uv run python alma/regenerate.py
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import frontmatter
-from . import indexes, wiki_links
+from . import indexes, notes, wiki_links
 
 NOTES_DIR = Path("notes")
 
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_THRESHOLD = 500
+
+
+def _parse_note(md_file: str):
+    """Parse one note file: (metadata, wiki links, error message)."""
+    try:
+        metadata, content = notes.read_note_file(md_file)
+        return metadata, wiki_links.extract_wiki_links(content), None
+    except Exception as e:
+        # Exceptions don't always pickle; send the message back instead
+        return None, None, str(e)
+
+
+def _parse_notes(md_files: list) -> list:
+    """Parse note files, in worker processes when there are many."""
+    if len(md_files) < PARALLEL_THRESHOLD:
+        return [_parse_note(md_file) for md_file in md_files]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_parse_note, md_files, chunksize=64))
+
 
 def regenerate_all_indexes():
     """Rebuild all indexes from markdown files."""
     print("🔄 Regenerating all indexes from markdown files...")
 
+    # Parse before clearing, so the indexes are empty only while rebuilding
+    md_files = list(notes.iter_note_files(NOTES_DIR))
+    parsed = _parse_notes(md_files)
+
     # Clear existing indexes
     print("  Clearing old indexes...")
     indexes.clear_all_indexes()
@@ -30,43 +63,61 @@ def regenerate_all_indexes():
     count = 0
     errors = 0
 
-    # Scan all markdown files
-    for md_file in NOTES_DIR.rglob("*.md"):
-        try:
-            post = frontmatter.load(md_file)
-            metadata = post.metadata
+    # Collect every index in plain dicts (dicts as ordered sets of note IDs)
+    projects_index = {}
+    tags_index = {}
+    metadata_index = {}
+    links_index = {}
 
-            note_id = metadata.get("id")
-            if not note_id:
-                print(f"  ⚠️  Warning: {md_file} missing 'id' in frontmatter, skipping")
-                errors += 1
-                continue
+    for md_file, (metadata, links, error) in zip(md_files, parsed):
+        if error is not None:
+            print(f"  ❌ Error processing {md_file}: {error}")
+            errors += 1
+            continue
 
-            # Rebuild all indexes
+        note_id = metadata.get("id")
+        if not note_id:
+            print(f"  ⚠️  Warning: {md_file} missing 'id' in frontmatter, skipping")
+            errors += 1
+            continue
+        note_id = str(note_id)  # Hand-written frontmatter may hold e.g. a number
+
+        try:
             project = metadata.get("project", "unknown")
             tags = metadata.get("tags", [])
-            title = metadata.get("title", "Untitled")
-            created = metadata.get("created", "")
-            modified = metadata.get("modified", "")
-            content_type = metadata.get("type", "note")
-
-            indexes.add_to_project_index(project, note_id)
-            indexes.add_to_tags_index(tags, note_id)
-            indexes.add_to_metadata_index(
-                note_id, title, created, modified, str(md_file), project, content_type, tags
+            entry = indexes.metadata_entry(
+                metadata.get("title", "Untitled"),
+                metadata.get("created", ""),
+                metadata.get("modified", ""),
+                md_file,
+                project,
+                metadata.get("type", "note"),
+                tags,
+                metadata.get("user"),
             )
-
-            # Extract and index wiki-links
-            links = wiki_links.extract_wiki_links(post.content)
-            wiki_links.add_wiki_links_to_index(note_id, links)
-
-            count += 1
-
         except Exception as e:
             print(f"  ❌ Error processing {md_file}: {e}")
             errors += 1
             continue
 
+        # Index keys must be strings
+        projects_index.setdefault(str(project), {})[note_id] = None
+        for tag in map(str, tags):
+            tags_index.setdefault(tag, {})[note_id] = None
+        metadata_index[note_id] = entry
+        links_index[note_id] = links
+
+        count += 1
+
+    # Save each index once, as one batch written out in a single flush
+    with indexes.batch():
+        indexes.replace_note_indexes(
+            {project: list(ids) for project, ids in projects_index.items()},
+            {tag: list(ids) for tag, ids in tags_index.items()},
+            metadata_index,
+        )
+        wiki_links.replace_wiki_link_indexes(links_index)
+
     print(f"\n✓ Regeneration complete!")
     print(f"  - Indexed: {count} notes")
     if errors:
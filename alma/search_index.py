@@ -0,0 +1,85 @@
+"""In-memory trigram index over note titles for substring search.
+
+Notes are identified by the integer doc IDs assigned in ``indexes``; postings
+are sets of those IDs. A query is answered by intersecting the postings of
+its trigrams and verifying the few surviving titles with a real substring
+check. The index is derived from the metadata index and is never persisted.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Trigram -> doc IDs of titles containing it
+TRIGRAMS: Dict[str, Set[int]] = {}
+
+# Lowercased title per doc ID, for verifying candidates
+_TITLES: Dict[int, str] = {}
+_built = False
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Get all three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def is_built() -> bool:
+    """Check whether the index has been populated."""
+    return _built
+
+
+def build(titles: Iterable[Tuple[int, str]]):
+    """Rebuild the index from (doc_id, title) pairs."""
+    global _built
+    clear()
+    for doc_id, title in titles:
+        add(doc_id, title)
+    _built = True
+
+
+def clear():
+    """Drop all postings (the index must be rebuilt before searching)."""
+    global _built
+    TRIGRAMS.clear()
+    _TITLES.clear()
+    _built = False
+
+
+def add(doc_id: int, title: str):
+    """Index a note title, replacing any previous title for the note."""
+    remove(doc_id)
+
+    title_lower = title.lower()
+    _TITLES[doc_id] = title_lower
+    for trigram in _trigrams(title_lower):
+        TRIGRAMS.setdefault(trigram, set()).add(doc_id)
+
+
+def remove(doc_id: int):
+    """Remove a note from the index."""
+    title_lower = _TITLES.pop(doc_id, None)
+    if title_lower is None:
+        return
+    for trigram in _trigrams(title_lower):
+        postings = TRIGRAMS.get(trigram)
+        if postings is not None:
+            postings.discard(doc_id)
+            if not postings:  # Remove empty postings
+                del TRIGRAMS[trigram]
+
+
+def search(query: str) -> List[int]:
+    """Get doc IDs of notes whose title contains query (case-insensitive)."""
+    query_lower = query.lower()
+    trigrams = _trigrams(query_lower)
+
+    if trigrams:
+        postings = [TRIGRAMS.get(t) for t in trigrams]
+        if not all(postings):
+            return []
+        # Intersect smallest first to keep intermediate sets small
+        postings.sort(key=len)
+        candidates = set.intersection(*postings)
+    else:
+        # Queries shorter than a trigram can't use the postings
+        candidates = _TITLES.keys()
+
+    return [doc_id for doc_id in candidates if query_lower in _TITLES[doc_id]]
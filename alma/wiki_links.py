@@ -1,15 +1,18 @@
 """Wiki-link parsing and indexing."""
 
 import re
-from typing import Set, List
+from typing import Dict, Set, List
 from . import indexes
 from pathlib import Path
 
-# Pattern to match [[wiki links]]
-WIKI_LINK_PATTERN = re.compile(r'\[\[([^\]]+)\]\]')
+# Pattern to match [[wiki links]]; a link never spans lines
+WIKI_LINK_PATTERN = re.compile(r'\[\[([^\]\n]+)\]\]')
 
 # Wiki-links index file
-WIKI_LINKS_INDEX = indexes.INDEXES_DIR / "wiki-links.json"
+WIKI_LINKS_INDEX = indexes.WIKI_LINKS_INDEX
+
+# Inverse of the wiki-links index: lowercased link text -> linking note IDs
+WIKI_BACKLINKS_INDEX = indexes.WIKI_BACKLINKS_INDEX
 
 
 def extract_wiki_links(content: str) -> Set[str]:
@@ -19,44 +22,90 @@ def extract_wiki_links(content: str) -> Set[str]:
 
 def add_wiki_links_to_index(note_id: str, links: Set[str]):
     """Store wiki links for a note."""
-    index = indexes.load_index(WIKI_LINKS_INDEX)
-    index[note_id] = list(links)
-    indexes.save_index(WIKI_LINKS_INDEX, index)
+    with indexes.LOCK:
+        backlinks = _load_backlinks()  # Before the links change, if it must be built
+        index = indexes.load_index(WIKI_LINKS_INDEX)
+        # Sorted, so an unchanged link set compares equal and is skipped
+        links_list = sorted(links)
+        if index.get(note_id) == links_list:
+            return
+        old_targets = _targets(index.get(note_id, []))
+        index[note_id] = links_list
+        indexes.save_index(WIKI_LINKS_INDEX, index)
+        _update_backlinks(backlinks, note_id, old_targets, _targets(links))
 
 
 def remove_wiki_links_from_index(note_id: str):
     """Remove wiki links for a note."""
-    index = indexes.load_index(WIKI_LINKS_INDEX)
-    if note_id in index:
-        del index[note_id]
+    with indexes.LOCK:
+        backlinks = _load_backlinks()
+        index = indexes.load_index(WIKI_LINKS_INDEX)
+        if note_id in index:
+            old_targets = _targets(index.pop(note_id))
+            indexes.save_index(WIKI_LINKS_INDEX, index)
+            _update_backlinks(backlinks, note_id, old_targets, set())
+
+
+def replace_wiki_link_indexes(links_by_note: Dict[str, Set[str]]):
+    """Replace the wiki-links and backlinks indexes wholesale (for regeneration)."""
+    index = {}
+    backlinks = {}
+    for note_id, links in links_by_note.items():
+        index[note_id] = sorted(links)
+        for target in _targets(links):
+            backlinks.setdefault(target, []).append(note_id)
+    with indexes.LOCK:
         indexes.save_index(WIKI_LINKS_INDEX, index)
+        indexes.save_index(WIKI_BACKLINKS_INDEX, backlinks)
+        indexes.mark_built(WIKI_BACKLINKS_INDEX)
+
+
+def _targets(links) -> Set[str]:
+    """Lowercased titles a set of links points at."""
+    return {link.lower() for link in links}
+
+
+def _load_backlinks() -> dict:
+    """Load the backlinks index, building it from the wiki-links index if missing."""
+    with indexes.LOCK:
+        backlinks = indexes.load_index(WIKI_BACKLINKS_INDEX)
+        if indexes.is_built(WIKI_BACKLINKS_INDEX):
+            return backlinks
+        # First use since the indexes were (re)loaded: build it only if the
+        # file doesn't exist yet (e.g. an install from before this index)
+        if not backlinks and not WIKI_BACKLINKS_INDEX.exists():
+            for note_id, links in indexes.load_index(WIKI_LINKS_INDEX).items():
+                for target in _targets(links):
+                    backlinks.setdefault(target, []).append(note_id)
+            indexes.save_index(WIKI_BACKLINKS_INDEX, backlinks)
+        indexes.mark_built(WIKI_BACKLINKS_INDEX)
+        return backlinks
+
+
+def _update_backlinks(backlinks: dict, note_id: str, old_targets: Set[str], new_targets: Set[str]):
+    """Apply the change in a note's link targets to the backlinks index."""
+    if old_targets == new_targets:
+        return
+    for target in old_targets - new_targets:
+        note_ids = backlinks.get(target)
+        if note_ids and note_id in note_ids:
+            note_ids.remove(note_id)
+            if not note_ids:  # Remove empty entries
+                del backlinks[target]
+    for target in new_targets - old_targets:
+        backlinks.setdefault(target, []).append(note_id)
+    indexes.save_index(WIKI_BACKLINKS_INDEX, backlinks)
 
 
 def get_backlinks(note_title: str) -> List[str]:
     """Find all notes that link to this note title."""
-    index = indexes.load_index(WIKI_LINKS_INDEX)
-    backlinks = []
-    note_title_lower = note_title.lower()
-
-    for note_id, links in index.items():
-        # Case-insensitive comparison
-        if any(link.lower() == note_title_lower for link in links):
-            backlinks.append(note_id)
-
-    return backlinks
+    with indexes.LOCK:
+        return list(_load_backlinks().get(note_title.lower(), []))
 
 
 def resolve_wiki_link(link_text: str) -> str | None:
     """Find note ID by title (case-insensitive match)."""
-    all_metadata = indexes.get_all_metadata(limit=1000)
-    link_lower = link_text.lower()
-
-    # Try exact match first
-    for meta in all_metadata:
-        if meta["title"].lower() == link_lower:
-            return meta["id"]
-
-    return None
+    return indexes.get_note_id_by_title(link_text)
 
 
 def render_wiki_links(content: str) -> str:
@@ -72,4 +121,4 @@ def render_wiki_links(content: str) -> str:
             # Note not found - show as broken link
             return f'<span class="wiki-link-broken">[[{link_text}]]</span>'
 
-    return re.sub(WIKI_LINK_PATTERN, replace_link, content)
+    return WIKI_LINK_PATTERN.sub(replace_link, content)
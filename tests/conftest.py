@@ -1,8 +1,6 @@
 """Pytest configuration and fixtures."""
 
 import os
-import tempfile
-import shutil
 from pathlib import Path
 import pytest
 from fastapi.testclient import TestClient
@@ -27,11 +25,15 @@ def test_env():
 
 
 @pytest.fixture
-def temp_notes_dir():
-    """Create a temporary directory for notes during testing."""
-    temp_dir = tempfile.mkdtemp()
-    notes_dir = Path(temp_dir) / "notes"
-    indexes_dir = Path(temp_dir) / ".indexes"
+def temp_notes_dir(tmp_path_factory, monkeypatch):
+    """Create a temporary directory for notes during testing.
+
+    Directories come from pytest's session-wide temp root, which pytest
+    prunes itself, so there is no per-test rmtree.
+    """
+    temp_dir = tmp_path_factory.mktemp("notes", numbered=True)
+    notes_dir = temp_dir / "notes"
+    indexes_dir = temp_dir / ".indexes"
     notes_dir.mkdir(parents=True, exist_ok=True)
     indexes_dir.mkdir(parents=True, exist_ok=True)
 
@@ -40,15 +42,14 @@ def temp_notes_dir():
     (notes_dir / "work").mkdir(exist_ok=True)
     (notes_dir / "reference").mkdir(exist_ok=True)
 
-    # Monkey patch the notes directory
-    original_notes_dir = os.getcwd()
-    os.chdir(temp_dir)
+    # Run the test inside the temp directory (restored by monkeypatch)
+    monkeypatch.chdir(temp_dir)
 
-    yield temp_dir
+    yield str(temp_dir)
 
-    # Cleanup
-    os.chdir(original_notes_dir)
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    # Write pending index changes while still inside the temp directory
+    from alma import indexes
+    indexes.reload_indexes()
 
 
 @pytest.fixture
@@ -53,3 +53,45 @@ def test_logout(authenticated_client):
 
     # Verify cookie is deleted
     assert "session" not in response.cookies or response.cookies["session"] == ""
+
+
+def test_http_client_is_shared():
+    """Test that OAuth calls share one HTTP client until it is closed."""
+    import asyncio
+    from alma import auth
+
+    client = auth.get_http_client()
+    assert auth.get_http_client() is client
+
+    asyncio.run(auth.close_http_client())
+    assert client.is_closed
+    assert auth.get_http_client() is not client
+    asyncio.run(auth.close_http_client())
+
+
+def test_invalid_session_redirects(client):
+    """Test that a tampered session cookie is redirected to login."""
+    client.cookies.set("session", "tampered")
+    response = client.get("/notes", follow_redirects=False)
+    assert response.status_code == 302
+    assert response.headers["location"] == "/login"
+
+
+def test_google_auth_url():
+    """Test that the auth URL carries the per-host redirect URI."""
+    from alma.auth import get_google_auth_url
+
+    url = get_google_auth_url("http://example.com/auth/callback")
+    assert url.startswith("https://accounts.google.com/")
+    assert "redirect_uri=http%3A%2F%2Fexample.com%2Fauth%2Fcallback" in url
+    assert get_google_auth_url("http://other.com/auth/callback") != url
+
+
+def test_login_page_cached(client):
+    """Test that both login page variants are served with cache headers."""
+    response = client.get("/login")
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    assert b"Authentication failed" not in response.content
+
+    response = client.get("/login?error=auth_failed")
+    assert b"Authentication failed" in response.content
@@ -0,0 +1,44 @@
+"""Tests for caching utilities."""
+
+from alma import caching
+
+
+def test_cache_set_get_and_eviction(monkeypatch):
+    """Test TTL expiry and least-recently-used eviction."""
+    caching.cache_clear()
+    monkeypatch.setattr(caching, "_cache_maxsize", 2)
+
+    caching.cache_set("note:a", 1)
+    caching.cache_set("note:b", 2)
+    assert caching.cache_get("note:a") == 1  # "b" is now least recently used
+
+    caching.cache_set("note:c", 3)
+    assert caching.cache_get("note:b") is None
+    assert caching.cache_get("note:a") == 1
+    assert caching.cache_get("note:c") == 3
+
+    monkeypatch.setattr(caching, "_cache_timeout", -1)
+    caching.cache_set("note:d", 4)
+    assert caching.cache_get("note:d") is None
+
+    caching.cache_clear()
+
+
+def test_cache_invalidate_pattern():
+    """Test invalidating by namespace prefix and by substring."""
+    caching.cache_clear()
+    caching.cache_set("notes:page1", 1)
+    caching.cache_set("notes:page2", 2)
+    caching.cache_set("tag:python", 3)
+    caching.cache_set("project:work", 4)
+
+    caching.cache_invalidate_pattern("notes:")
+    assert caching.cache_get("notes:page1") is None
+    assert caching.cache_get("notes:page2") is None
+    assert caching.cache_get("tag:python") == 3
+
+    caching.cache_invalidate_pattern("work")
+    assert caching.cache_get("project:work") is None
+    assert caching.cache_get("tag:python") == 3
+
+    caching.cache_clear()
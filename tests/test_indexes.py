@@ -73,3 +73,259 @@ def test_metadata_index(temp_notes_dir):
     all_metadata = indexes.get_all_metadata()
     note_found = any(m["id"] == note_id for m in all_metadata)
     assert note_found
+
+
+def test_index_flush_and_reload(temp_notes_dir):
+    """Test that in-memory index changes are flushed to disk and reloaded."""
+    indexes.add_to_project_index("personal", "flushed-note")
+
+    indexes.flush_all()
+    index_file = Path(temp_notes_dir) / ".indexes" / "projects.json"
+    assert "flushed-note" in index_file.read_text()
+
+    # Dropping the in-memory copy re-reads the same data from disk
+    indexes.reload_indexes()
+    assert "flushed-note" in indexes.get_notes_by_project("personal")
+
+
+def test_search_titles(temp_notes_dir):
+    """Test case-insensitive title search, newest first."""
+    indexes.add_to_metadata_index("old", "Python basics", "2025-01-01", "2025-01-01", "a.md", "personal", "note", [])
+    indexes.add_to_metadata_index("new", "Advanced PYTHON", "2025-02-01", "2025-02-01", "b.md", "personal", "note", [])
+    indexes.add_to_metadata_index("other", "JavaScript", "2025-03-01", "2025-03-01", "c.md", "personal", "note", [])
+
+    assert indexes.search_titles("python") == ["new", "old"]
+    assert indexes.search_titles("python", limit=1) == ["new"]
+    assert [m["id"] for m in indexes.get_metadata_batch(["other", "missing", "old"])] == ["other", "old"]
+
+
+def test_get_all_metadata_sorted_and_paginated(temp_notes_dir):
+    """Test that metadata pages stay sorted newest first across mutations."""
+    for i in range(5):
+        indexes.add_to_metadata_index(f"n{i}", f"Note {i}", f"2025-01-0{i + 1}", "", "x.md", "personal", "note", [])
+
+    assert [m["id"] for m in indexes.get_all_metadata(limit=2)] == ["n4", "n3"]
+    assert [m["id"] for m in indexes.get_all_metadata(limit=2, offset=2)] == ["n2", "n1"]
+
+    indexes.update_metadata_index("n0", created="2025-02-01")
+    indexes.remove_from_metadata_index("n4")
+    assert [m["id"] for m in indexes.get_all_metadata(limit=3)] == ["n0", "n3", "n2"]
+    assert indexes.get_all_metadata(offset=10) == []
+
+
+def test_get_metadata_page(temp_notes_dir):
+    """Test paginating a subset of notes by created date."""
+    for i in range(4):
+        indexes.add_to_metadata_index(f"p{i}", f"Note {i}", f"2025-01-0{i + 1}", "", "x.md", "personal", "note", [])
+
+    page = indexes.get_metadata_page(["p0", "p2", "p3", "missing"], limit=2, offset=1)
+    assert [m["id"] for m in page] == ["p2", "p0"]
+
+
+def test_dirty_marker(temp_notes_dir):
+    """Test that unflushed changes leave a marker that the flush removes."""
+    indexes.add_to_tags_index(["marker"], "note-1")
+    assert indexes.needs_recovery()
+
+    indexes.flush_all()
+    assert not indexes.needs_recovery()
+
+
+def test_update_tags_index(temp_notes_dir):
+    """Test moving a note between tags."""
+    indexes.add_to_tags_index(["keep", "old"], "note-1")
+
+    indexes.update_tags_index(["keep", "old"], ["keep", "new"], "note-1")
+
+    assert indexes.get_notes_by_tag("keep") == ["note-1"]
+    assert indexes.get_notes_by_tag("new") == ["note-1"]
+    assert "old" not in indexes.get_all_tags()
+
+
+def test_doc_ids():
+    """Test that notes get stable internal integer IDs."""
+    first = indexes.doc_id("uuid-doc-a")
+    second = indexes.doc_id("uuid-doc-b")
+
+    assert first != second
+    assert indexes.doc_id("uuid-doc-a") == first
+    assert indexes.note_id_for(second) == "uuid-doc-b"
+
+
+def test_notes_by_project_and_tags(temp_notes_dir):
+    """Test intersecting project and tag postings."""
+    indexes.add_to_project_index("work", "both")
+    indexes.add_to_project_index("work", "project-only")
+    indexes.add_to_project_index("personal", "other-project")
+    indexes.add_to_tags_index(["urgent", "review"], "both")
+    indexes.add_to_tags_index(["urgent"], "other-project")
+
+    assert indexes.get_notes_by_project_and_tags("work", ["urgent"]) == ["both"]
+    assert sorted(indexes.get_notes_by_project_and_tags(None, ["urgent"])) == ["both", "other-project"]
+    assert indexes.get_notes_by_project_and_tags("work", ["urgent", "missing"]) == []
+
+    # Postings follow later index changes
+    indexes.remove_from_tags_index(["urgent"], "both")
+    assert indexes.get_notes_by_project_and_tags("work", ["urgent"]) == []
+
+
+def test_batch_defers_flush(temp_notes_dir):
+    """Test that a batch of updates schedules a single flush at the end."""
+    indexes.flush_all()
+
+    with indexes.batch():
+        indexes.add_to_project_index("personal", "batched")
+        indexes.add_to_tags_index(["batched"], "batched")
+        assert indexes._flush_timer is None
+
+    assert indexes._flush_timer is not None
+    indexes.flush_all()
+    assert "batched" in (Path(temp_notes_dir) / ".indexes" / "tags.json").read_text()
+
+
+def test_note_id_by_title(temp_notes_dir):
+    """Test case-insensitive title lookup, preferring the newest note."""
+    indexes.add_to_metadata_index(
+        "old", "Shared Title", "2024-01-01T00:00:00", "2024-01-01T00:00:00",
+        "notes/personal/old.md", "personal", "note", []
+    )
+    indexes.add_to_metadata_index(
+        "new", "shared title", "2024-02-01T00:00:00", "2024-02-01T00:00:00",
+        "notes/personal/new.md", "personal", "note", []
+    )
+
+    assert indexes.get_note_id_by_title("SHARED TITLE") == "new"
+    assert indexes.get_note_id_by_title("missing") is None
+
+    # The lookup follows later renames and removals
+    indexes.update_metadata_index("new", title="Renamed")
+    assert indexes.get_note_id_by_title("shared title") == "old"
+    indexes.remove_from_metadata_index("old")
+    assert indexes.get_note_id_by_title("shared title") is None
+
+
+def test_regenerate_all_indexes(temp_notes_dir):
+    """Test rebuilding the indexes from JSON and YAML frontmatter files."""
+    from alma import notes, regenerate, wiki_links
+
+    created = notes.create_note("Linking note\n\nSee [[Old Note]]", "personal", "note", ["x"], "test@example.com")
+    md_file = Path(temp_notes_dir) / "notes" / "work" / "old.md"
+    md_file.write_text("---\nid: old\ntitle: Old Note\nproject: work\ntags:\n- y\n---\n\nBody")
+    (Path(temp_notes_dir) / "notes" / "work" / "no-id.md").write_text("No frontmatter")
+
+    assert regenerate.regenerate_all_indexes() == 2
+    assert indexes.get_notes_by_project("work") == ["old"]
+    assert indexes.get_notes_by_tag("x") == [created["id"]]
+    assert indexes.get_note_metadata("old")["title"] == "Old Note"
+    assert wiki_links.get_backlinks("old note") == [created["id"]]
+
+
+def test_regenerate_in_worker_processes(temp_notes_dir, monkeypatch):
+    """Test that parsing in worker processes gives the same indexes."""
+    from alma import notes, regenerate
+
+    monkeypatch.setattr(regenerate, "PARALLEL_THRESHOLD", 0)
+    created = [
+        notes.create_note(f"Note {i}", "personal", "note", [f"tag{i}"], "test@example.com")
+        for i in range(3)
+    ]
+
+    assert regenerate.regenerate_all_indexes() == 3
+    assert sorted(indexes.get_notes_by_project("personal")) == sorted(n["id"] for n in created)
+    assert indexes.get_notes_by_tag("tag1") == [created[1]["id"]]
+
+
+def test_non_string_project_and_tags(temp_notes_dir):
+    """Test that numeric ids, projects and tags from hand-written frontmatter are indexed as strings."""
+    from alma import regenerate, wiki_links
+
+    notes_dir = Path(temp_notes_dir) / "notes" / "work"
+    (notes_dir / "numbers.md").write_text("---\nid: numbers\ntitle: Numbers\nproject: 2024\ntags: [2024, q1]\n---\n\nBody")
+    (notes_dir / "numeric-id.md").write_text("---\nid: 123\ntitle: Numeric\nproject: work\n---\n\nSee [[Numbers]]")
+
+    assert regenerate.regenerate_all_indexes() == 2
+    indexes.flush_all()
+    assert not indexes.needs_recovery()
+    assert indexes.get_notes_by_project("2024") == ["numbers"]
+    assert indexes.get_all_tags() == ["2024", "q1"]
+    assert indexes.get_note_metadata("123")["title"] == "Numeric"
+    assert wiki_links.get_backlinks("Numbers") == ["123"]
+
+    indexes.remove_from_tags_index([2024], "numbers")
+    assert indexes.get_all_tags() == ["q1"]
+
+
+def test_flush_skips_unencodable_index(temp_notes_dir):
+    """Test that one index that can't be encoded doesn't block the others."""
+    bad_index = indexes.INDEXES_DIR / "bad.json"
+    indexes.save_index(bad_index, {"note": object()})
+    indexes.add_to_project_index("personal", "good")
+
+    indexes.flush_all()
+    assert "good" in indexes.PROJECTS_INDEX.read_text()
+    assert not bad_index.exists()
+    assert indexes.needs_recovery()
+
+
+def test_regenerate_keeps_projects_config(temp_notes_dir):
+    """Test that clearing the indexes for regeneration leaves projects alone."""
+    from alma import projects, regenerate
+
+    projects.create_project("Kept")
+    regenerate.regenerate_all_indexes()
+
+    assert projects.project_exists("kept")
+    assert "Kept" in projects.PROJECTS_CONFIG.read_text()
+
+
+def test_regenerate_creates_indexes_directory(temp_notes_dir):
+    """Test that regeneration works before the indexes directory exists."""
+    import shutil
+    from alma import regenerate
+
+    shutil.rmtree(Path(temp_notes_dir) / ".indexes")
+    assert regenerate.regenerate_all_indexes() == 0
+    assert indexes.METADATA_INDEX.exists()
+
+
+def test_regenerate_yaml_timestamps(temp_notes_dir):
+    """Test that unquoted YAML timestamps are indexed as ISO strings and sort with the rest."""
+    from alma import notes, regenerate
+
+    created = notes.create_note("Written by the app", "personal", "note", [], "test@example.com")
+    md_file = Path(temp_notes_dir) / "notes" / "work" / "dated.md"
+    md_file.write_text(
+        "---\nid: dated\ntitle: Dated\nproject: work\n"
+        "created: 2024-01-01T10:00:00\nmodified: 2024-01-02\n---\n\nBody"
+    )
+
+    assert regenerate.regenerate_all_indexes() == 2
+    assert indexes.get_note_metadata("dated")["created"] == "2024-01-01T10:00:00"
+    assert indexes.get_note_metadata("dated")["modified"] == "2024-01-02"
+    assert [m["id"] for m in indexes.get_all_metadata()] == [created["id"], "dated"]
+    assert indexes.search_titles("t") == [created["id"], "dated"]
+
+
+def test_flush_keeps_index_dirty_when_replace_fails(temp_notes_dir, monkeypatch):
+    """Test that an index whose temp file can't be swapped in stays dirty for the next flush."""
+    import os
+
+    real_replace = os.replace
+
+    def replace(src, dst):
+        if Path(dst).name == "tags.json":
+            raise FileNotFoundError(src)
+        real_replace(src, dst)
+
+    indexes.add_to_project_index("personal", "kept")
+    indexes.add_to_tags_index(["retry"], "kept")
+    monkeypatch.setattr(indexes.os, "replace", replace)
+    indexes.flush_all()
+
+    assert "kept" in indexes.PROJECTS_INDEX.read_text()
+    assert indexes.needs_recovery()
+
+    monkeypatch.setattr(indexes.os, "replace", real_replace)
+    indexes.flush_all()
+    assert "retry" in indexes.TAGS_INDEX.read_text()
+    assert not indexes.needs_recovery()
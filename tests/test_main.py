@@ -1,3 +1,40 @@
+from pathlib import Path
+
 
 def test_main():
     pass
+
+
+def test_static_files_cached(client):
+    """Test that static files are served without auth and with cache headers."""
+    response = client.get("/static/css/responsive.css")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=86400"
+
+
+def test_index_etag(authenticated_client):
+    """Test that the main page answers 304 until the notes change."""
+    authenticated_client.get("/")
+    etag = authenticated_client.get("/").headers["etag"]
+
+    response = authenticated_client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    authenticated_client.post(
+        "/notes",
+        data={"project": "personal", "content_type": "note", "tags": "", "content": "Changed"},
+    )
+    response = authenticated_client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_startup_creates_directories(temp_notes_dir):
+    """Test that app startup, not import, creates the notes directories."""
+    import shutil
+    from fastapi.testclient import TestClient
+    from alma.main import app
+
+    shutil.rmtree(Path(temp_notes_dir) / "notes")
+    with TestClient(app):
+        assert (Path(temp_notes_dir) / "notes" / "default").is_dir()
@@ -131,3 +131,114 @@ def test_delete_note(authenticated_client):
     # In a real scenario, we'd parse the HTML or use the API to get the ID
     # For now, we just verify the create succeeded
     assert create_response.status_code == 200
+
+
+def test_get_note_uses_metadata_index(temp_notes_dir):
+    """Test loading a note by ID via the metadata index."""
+    from alma import notes
+
+    created = notes.create_note("Indexed note\n\nBody text", "personal", "note", ["a"], "test@example.com")
+
+    note = notes.get_note(created["id"])
+    assert note["title"] == "Indexed note"
+    assert note["content"] == "Indexed note\n\nBody text"
+    assert note["user"] == "test@example.com"
+    assert notes._find_file_by_id(created["id"]) == Path(created["file_path"])
+
+
+def test_read_frontmatter_only(temp_notes_dir):
+    """Test parsing the frontmatter block without the note body."""
+    from alma import notes
+
+    md_file = Path(temp_notes_dir) / "notes" / "personal" / "header.md"
+    md_file.write_text("---\nid: abc\ntitle: Header\n---\n\n" + "body\n" * 5000)
+
+    assert notes._read_frontmatter_only(md_file) == {"id": "abc", "title": "Header"}
+
+
+def test_list_notes_from_index(temp_notes_dir):
+    """Test listing notes newest first, optionally by project."""
+    from alma import indexes, notes
+
+    first = notes.create_note("First", "personal", "note", [], "test@example.com")
+    second = notes.create_note("Second", "work", "note", [], "test@example.com")
+    # Both are created within the same second; make the order explicit
+    indexes.update_metadata_index(first["id"], created="2025-01-01")
+    indexes.update_metadata_index(second["id"], created="2025-01-02")
+
+    assert [n["id"] for n in notes.list_notes()] == [second["id"], first["id"]]
+    assert [n["id"] for n in notes.list_notes(project="personal")] == [first["id"]]
+    assert notes.list_notes(limit=1)[0]["content"] == "Second"
+
+
+def test_update_note_refreshes_cached_content(temp_notes_dir):
+    """Test that a cached note body is replaced when the note is updated."""
+    from alma import notes
+
+    created = notes.create_note("Cached body", "personal", "note", [], "test@example.com")
+    assert notes.get_note(created["id"])["content"] == "Cached body"
+
+    updated = notes.update_note(created["id"], "Fresh body", [])
+    assert updated["content"] == "Fresh body"
+
+
+def test_read_frontmatter_only_without_frontmatter(temp_notes_dir):
+    """Test that files without a frontmatter block yield no metadata."""
+    from alma import notes
+
+    notes_dir = Path(temp_notes_dir) / "notes" / "personal"
+    (notes_dir / "empty.md").write_text("")
+    (notes_dir / "plain.md").write_text("Just text\n---\nmore")
+
+    assert notes._read_frontmatter_only(notes_dir / "empty.md") == {}
+    assert notes._read_frontmatter_only(notes_dir / "plain.md") == {}
+
+
+def test_note_frontmatter_is_json(temp_notes_dir):
+    """Test that notes are written with JSON frontmatter that YAML tools can still read."""
+    import frontmatter
+    from alma import notes
+
+    created = notes.create_note("JSON header", "personal", "note", ["x"], "test@example.com")
+
+    text = Path(created["file_path"]).read_text()
+    assert text.startswith('---\n{\n  "id"')
+    # Plain YAML frontmatter parsing sees the same metadata
+    assert frontmatter.loads(text).metadata["tags"] == ["x"]
+
+    # Existing YAML frontmatter still parses
+    yaml_file = Path(temp_notes_dir) / "notes" / "personal" / "yaml.md"
+    yaml_file.write_text("---\nid: old\ntags:\n- a\n---\nBody")
+    assert notes._read_frontmatter_only(yaml_file) == {"id": "old", "tags": ["a"]}
+
+
+def test_get_unindexed_note(temp_notes_dir):
+    """Test that notes missing from the index are found by scanning files."""
+    from alma import notes
+
+    md_file = Path(temp_notes_dir) / "notes" / "work" / "external.md"
+    md_file.write_text("---\nid: external-1\ntitle: External\nproject: work\n---\n\nWritten elsewhere")
+
+    note = notes.get_note("external-1")
+    assert note["title"] == "External"
+    assert note["content"] == "Written elsewhere"
+    assert note["file_path"] == str(md_file.relative_to(temp_notes_dir))
+
+
+def test_filter_notes_by_project_and_tag(authenticated_client):
+    """Test filtering notes by project and tag together."""
+    for project, tags, content in [
+        ("work", "urgent", "Urgent work note"),
+        ("work", "", "Calm work note"),
+        ("personal", "urgent", "Urgent personal note"),
+    ]:
+        authenticated_client.post(
+            "/notes",
+            data={"project": project, "content_type": "note", "tags": tags, "content": content}
+        )
+
+    response = authenticated_client.get("/notes?project=work&tag=urgent")
+    assert response.status_code == 200
+    assert b"Urgent work note" in response.content
+    assert b"Calm work note" not in response.content
+    assert b"Urgent personal note" not in response.content
@@ -74,3 +74,64 @@ def test_cannot_delete_default_project(authenticated_client):
     response = authenticated_client.delete("/projects/personal")
     # Should fail because it's a default project
     assert response.status_code in [400, 403, 404]
+
+
+def test_projects_config_cache(temp_notes_dir):
+    """Test that cached projects config is reused and refreshed on file changes."""
+    import json
+    from alma import projects
+
+    projects.create_project("Cached")
+    loaded = projects.load_projects_config()
+    assert [p["id"] for p in loaded] == ["default", "cached"]
+
+    # Returned projects are copies; mutating them doesn't touch the cache
+    loaded[1]["name"] = "Changed"
+    assert projects.get_project("cached")["name"] == "Cached"
+
+    # External edits are picked up
+    data = json.loads(projects.PROJECTS_CONFIG.read_text())
+    data["projects"][1]["name"] = "Edited"
+    projects.PROJECTS_CONFIG.write_text(json.dumps(data) + "\n")
+    assert projects.get_project("cached")["name"] == "Edited"
+
+
+def test_update_and_delete_project(temp_notes_dir):
+    """Test updating and deleting a project by ID."""
+    from alma import projects
+
+    projects.create_project("Lookup", color="green")
+    updated = projects.update_project("lookup", name="Renamed", color="red")
+    assert updated["name"] == "Renamed"
+    assert projects.get_project("lookup")["color"] == "red"
+    assert projects.project_exists("lookup")
+
+    projects.delete_project("lookup")
+    assert not projects.project_exists("lookup")
+    assert [p["id"] for p in projects.load_projects_config()] == ["default"]
+
+
+def test_project_note_counts(temp_notes_dir):
+    """Test that cached note counts follow index changes."""
+    from alma import indexes, projects
+
+    indexes.add_to_project_index("default", "note-1")
+    counts = {p["id"]: p["note_count"] for p in projects.get_all_projects()}
+    assert counts["default"] == 1
+
+    indexes.add_to_project_index("default", "note-2")
+    counts = {p["id"]: p["note_count"] for p in projects.get_all_projects()}
+    assert counts["default"] == 2
+
+
+def test_default_project_without_config(temp_notes_dir):
+    """Test that the default project is served, but never shared, before any config exists."""
+    from alma import projects
+
+    assert not projects.PROJECTS_CONFIG.exists()
+    loaded = projects.load_projects_config()
+    assert [p["id"] for p in loaded] == ["default"]
+
+    loaded[0]["name"] = "Changed"
+    assert projects.get_project("default")["name"] == "Default"
+    assert projects.DEFAULT_PROJECT["name"] == "Default"
@@ -0,0 +1,22 @@
+"""Tests for the title search index."""
+
+from alma import search_index
+
+
+def test_trigram_search():
+    """Test substring search over indexed titles."""
+    search_index.build([(1, "Python basics"), (2, "Advanced python"), (3, "JavaScript")])
+
+    assert sorted(search_index.search("PYTHON")) == [1, 2]
+    assert sorted(search_index.search("py")) == [1, 2]
+    assert search_index.search("rust") == []
+
+    # Re-adding a note replaces its old title
+    search_index.add(1, "Rust basics")
+    assert search_index.search("python") == [2]
+
+    search_index.remove(2)
+    assert search_index.search("python") == []
+
+    search_index.clear()
+    assert not search_index.is_built()
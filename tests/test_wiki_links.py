@@ -0,0 +1,56 @@
+"""Tests for wiki-link parsing and indexing."""
+
+from alma import indexes, wiki_links
+
+
+def test_extract_wiki_links():
+    """Test extracting links, ignoring brackets that span lines."""
+    content = "See [[Project Plan]] and [[Ideas]].\n[[broken\nlink]]"
+    assert wiki_links.extract_wiki_links(content) == {"Project Plan", "Ideas"}
+
+
+def test_backlinks(temp_notes_dir):
+    """Test that backlinks follow link changes, case-insensitively."""
+    wiki_links.add_wiki_links_to_index("a", {"Project Plan"})
+    wiki_links.add_wiki_links_to_index("b", {"project plan", "Ideas"})
+
+    assert wiki_links.get_backlinks("PROJECT PLAN") == ["a", "b"]
+    assert wiki_links.get_backlinks("ideas") == ["b"]
+
+    wiki_links.add_wiki_links_to_index("b", {"Ideas"})
+    assert wiki_links.get_backlinks("Project Plan") == ["a"]
+
+    wiki_links.remove_wiki_links_from_index("a")
+    assert wiki_links.get_backlinks("Project Plan") == []
+    assert indexes.load_index(wiki_links.WIKI_BACKLINKS_INDEX) == {"ideas": ["b"]}
+
+
+def test_backlinks_built_from_links_index(temp_notes_dir):
+    """Test that a missing backlinks index is rebuilt from the wiki-links index."""
+    wiki_links.add_wiki_links_to_index("a", {"Ideas"})
+    indexes.flush_all()
+    wiki_links.WIKI_BACKLINKS_INDEX.unlink()
+    indexes.reload_indexes()
+
+    assert wiki_links.get_backlinks("Ideas") == ["a"]
+
+
+def test_unchanged_links_not_saved(temp_notes_dir):
+    """Test that re-adding the same links leaves the index untouched."""
+    wiki_links.add_wiki_links_to_index("a", {"Ideas", "Plan"})
+    indexes.flush_all()
+    generation = indexes.generation()
+
+    wiki_links.add_wiki_links_to_index("a", {"Plan", "Ideas"})
+    assert indexes.generation() == generation
+    assert indexes.load_index(wiki_links.WIKI_LINKS_INDEX)["a"] == ["Ideas", "Plan"]
+
+
+def test_backlinks_built_once(temp_notes_dir):
+    """Test that a missing backlinks index is built once, not on every call before the first flush."""
+    wiki_links.add_wiki_links_to_index("a", set())
+    generation = indexes.generation()
+
+    assert wiki_links.get_backlinks("Ideas") == []
+    assert not wiki_links.WIKI_BACKLINKS_INDEX.exists()
+    assert indexes.generation() == generation